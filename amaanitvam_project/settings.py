@@ -68,6 +68,7 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # CORS - must be before CommonMiddleware
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files in production
+    'django.middleware.http.ConditionalGetMiddleware',  # ETags + 304s for unchanged pages
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -118,10 +119,35 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Reuse connections across requests instead of reconnecting each time.
+        # Set DB_CONN_MAX_AGE=0 if a transaction-mode pooler (e.g. PgBouncer)
+        # is put in front of the database; it then does the pooling.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory is per-process; switch to Redis/Memcached when running
+# multiple workers so cache invalidation reaches every process.
+
+# File-based so every worker process sees the same entries and the
+# invalidation in core/signals.py (and seed_content) reaches all of them.
+# Workers on separate hosts need CACHE_DIR on shared storage.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_DIR', str(BASE_DIR / '.cache')),
+    }
+}
+
+# Seconds that static pages (about, policies) are cached server-side and by
+# browsers/CDNs. Admin edits to site content can take this long to show there.
+STATIC_PAGE_CACHE_TIMEOUT = int(os.getenv('STATIC_PAGE_CACHE_TIMEOUT', '600'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -187,6 +213,10 @@ RAZORPAY_KEY_SECRET = os.getenv('RAZORPAY_KEY_SECRET')
 # Currency for donations
 RAZORPAY_CURRENCY = os.getenv('RAZORPAY_CURRENCY', 'INR')
 
+# Seconds to wait on Razorpay API calls before giving up, so a slow or
+# unreachable API can't hold a worker indefinitely
+RAZORPAY_TIMEOUT = float(os.getenv('RAZORPAY_TIMEOUT', '10'))
+
 
 # =============================================================================
 # EMAIL CONFIGURATION
@@ -1,8 +1,17 @@
 from django.contrib import admin
-from django.utils.html import format_html
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 from .models import StoryPost, StoryImage, Donation, VolunteerFormLink, SiteContent, Project, ProjectImage, ProjectUpdate, StaticMedia
 
 
+# Static preview markup for StaticMediaAdmin; URLs are escaped and %-substituted
+_MEDIA_PREVIEW_IMG_HTML = '<img src="%s" style="max-width: 80px; max-height: 50px; object-fit: cover; border-radius: 4px;"/>'
+_MEDIA_PREVIEW_LARGE_IMG_HTML = '<img src="%s" style="max-width: 400px; max-height: 300px; object-fit: contain; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"/>'
+_MEDIA_PREVIEW_LARGE_VIDEO_HTML = '<video controls style="max-width: 400px; max-height: 300px; border-radius: 8px;"><source src="%s" type="video/mp4">Your browser does not support video.</video>'
+_MEDIA_PREVIEW_VIDEO_HTML = mark_safe('<span style="color: #666; font-size: 11px;">🎬 Video uploaded</span>')
+_MEDIA_PREVIEW_NONE_HTML = mark_safe('<span style="color: #999;">No media</span>')
+
+
 class StoryImageInline(admin.TabularInline):
     """Inline admin for adding multiple images to a story."""
     model = StoryImage
@@ -20,11 +29,14 @@ class StoryPostAdmin(admin.ModelAdmin):
         'title',
         'category',
         'is_published',
-        'has_video',
+        'has_video_cached',
         'created_date',
     ]
-    list_filter = ['category', 'is_published', 'created_date']
-    search_fields = ['title', 'body']
+    list_filter = ['category', 'is_published', 'has_video_cached', 'created_date']
+    list_per_page = 50
+    show_full_result_count = False
+    # Title only: matching against the full HTML body scans every post's text
+    search_fields = ['title']
     prepopulated_fields = {'slug': ('title',)}
     
     inlines = [StoryImageInline]
@@ -42,12 +54,6 @@ class StoryPostAdmin(admin.ModelAdmin):
         }),
     )
 
-    def has_video(self, obj):
-        """Display if story has video content."""
-        return obj.has_video()
-    has_video.boolean = True
-    has_video.short_description = 'Has Video'
-
 
 @admin.register(Donation)
 class DonationAdmin(admin.ModelAdmin):
@@ -61,6 +67,9 @@ class DonationAdmin(admin.ModelAdmin):
         'date',
     ]
     list_filter = ['status', 'date']
+    # Skip the unfiltered COUNT(*) on every filtered/searched page
+    list_per_page = 50
+    show_full_result_count = False
     search_fields = ['donor_name', 'donor_email', 'transaction_id', 'razorpay_order_id']
     readonly_fields = [
         'razorpay_order_id',
@@ -70,6 +79,17 @@ class DonationAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     
+    def get_search_results(self, request, queryset, search_term):
+        # Razorpay IDs are pasted whole: match them exactly (case-sensitive)
+        # so the lookup uses the transaction_id / razorpay_order_id index
+        # instead of a LIKE scan over every search field
+        term = search_term.strip()
+        if term.startswith('pay_'):
+            return queryset.filter(transaction_id=term), False
+        if term.startswith('order_'):
+            return queryset.filter(razorpay_order_id=term), False
+        return super().get_search_results(request, queryset, search_term)
+    
     fieldsets = (
         ('Donor Information', {
             'fields': ('donor_name', 'donor_email', 'donor_phone'),
@@ -209,7 +229,13 @@ class ProjectAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related('images', 'updates')
+        queryset = super().get_queryset(request)
+        # Images/updates aren't shown on the changelist, so only prefetch them elsewhere;
+        # the list also skips loading the long description columns
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith('_changelist'):
+            return queryset.only(*self.list_display, 'slug')
+        return queryset.prefetch_related('images', 'updates')
 
 
 @admin.register(StaticMedia)
@@ -281,18 +307,12 @@ class StaticMediaAdmin(admin.ModelAdmin):
     
     def media_preview(self, obj):
         """Show small preview thumbnail in list view."""
-        from django.utils.safestring import mark_safe
-        try:
-            if obj.media_type == 'image' and obj.image and obj.image.name:
-                return format_html(
-                    '<img src="{}" style="max-width: 80px; max-height: 50px; object-fit: cover; border-radius: 4px;"/>',
-                    obj.image.url
-                )
-            elif obj.media_type == 'video' and obj.video and obj.video.name:
-                return mark_safe('<span style="color: #666; font-size: 11px;">🎬 Video uploaded</span>')
-        except (ValueError, FileNotFoundError):
-            pass
-        return mark_safe('<span style="color: #999;">No media</span>')
+        # cached_url holds the image URL already, so no storage call per row
+        if obj.media_type == 'image' and obj.cached_url:
+            return mark_safe(_MEDIA_PREVIEW_IMG_HTML % escape(obj.cached_url))
+        elif obj.media_type == 'video' and obj.video and obj.video.name:
+            return _MEDIA_PREVIEW_VIDEO_HTML
+        return _MEDIA_PREVIEW_NONE_HTML
     media_preview.short_description = 'Preview'
     
     def media_preview_large(self, obj):
@@ -301,15 +321,9 @@ class StaticMediaAdmin(admin.ModelAdmin):
             return "Save first to see preview"
         try:
             if obj.media_type == 'image' and obj.image and obj.image.name:
-                return format_html(
-                    '<img src="{}" style="max-width: 400px; max-height: 300px; object-fit: contain; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"/>',
-                    obj.image.url
-                )
+                return mark_safe(_MEDIA_PREVIEW_LARGE_IMG_HTML % escape(obj.image.url))
             elif obj.media_type == 'video' and obj.video and obj.video.name:
-                return format_html(
-                    '<video controls style="max-width: 400px; max-height: 300px; border-radius: 8px;"><source src="{}" type="video/mp4">Your browser does not support video.</video>',
-                    obj.video.url
-                )
+                return mark_safe(_MEDIA_PREVIEW_LARGE_VIDEO_HTML % escape(obj.video.url))
         except (ValueError, FileNotFoundError):
             pass
         return "No media uploaded yet"
@@ -0,0 +1,18 @@
+"""
+Cache keys and timeouts shared by views, context processors and the signal
+handlers in core.signals that invalidate them.
+"""
+
+# Assembled template dicts from core.context_processors and core.media_cache
+SITE_CONTENT_CACHE_KEY = 'core:site_content'
+STATIC_MEDIA_CACHE_KEY = 'core:static_media'
+CONTEXT_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+# Version token for the cached story card fragments (home, stories list,
+# story detail); core.signals drops it whenever a StoryPost changes
+STORY_CARDS_VERSION_CACHE_KEY = 'core:story_cards_version'
+STORY_CARDS_FRAGMENT_TIMEOUT = 60 * 10  # 10 minutes
+
+# Volunteer form link context for the ways-to-help page
+VOLUNTEER_LINK_CACHE_KEY = 'core:volunteer_link'
+VOLUNTEER_LINK_CACHE_TIMEOUT = 60 * 5  # 5 minutes
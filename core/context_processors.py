@@ -1,6 +1,27 @@
 """
 Context processors for making site content available in all templates.
 """
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+from .cache_keys import CONTEXT_CACHE_TIMEOUT, SITE_CONTENT_CACHE_KEY
+from .media_cache import get_static_media
+from .models import SiteContent
+
+
+def _build_site_content():
+    """Load every SiteContent row into a {key: content} dict."""
+    # Read raw columns instead of model instances; image paths are wrapped
+    # in a FieldFile so {{ site.key_name.url }} keeps working. The dict is
+    # unordered, so skip the Meta ordering and its sort on page/section.
+    image_field = SiteContent._meta.get_field('image_content')
+    rows = SiteContent.objects.order_by().values_list(
+        'key', 'content_type', 'text_content', 'image_content'
+    )
+    return {
+        key: image_field.attr_class(None, image_field, image) if content_type == 'image' else text
+        for key, content_type, text, image in rows
+    }
 
 
 def site_content(request):
@@ -8,32 +29,19 @@ def site_content(request):
     Make all site content available in templates via the 'site' variable.
     Usage in templates: {{ site.key_name }} or {{ site.key_name.url }} for images
     """
-    from .models import SiteContent
-    
-    content = {}
-    for item in SiteContent.objects.all():
-        if item.content_type == 'image':
-            content[item.key] = item.image_content
-        else:
-            content[item.key] = item.text_content
-    
+    # Lazy like request.user: admin pages and JSON views never read it
+    content = SimpleLazyObject(
+        lambda: cache.get_or_set(SITE_CONTENT_CACHE_KEY, _build_site_content, CONTEXT_CACHE_TIMEOUT)
+    )
     return {'site': content}
 
 
 def static_media(request):
     """
     Make all static media available in templates via the 'media' variable.
-    Usage in templates: 
+    Usage in templates:
         {{ media.home_hero_bg }} - returns URL string or None
-        {{ media.home_hero_bg_obj }} - returns the StaticMedia object
+        {{ media.home_hero_bg_obj.alt_text }} - alt text (also location, url, media_type)
     """
-    from .models import StaticMedia
-    
-    media = {}
-    for item in StaticMedia.objects.filter(is_active=True):
-        # Store the URL for easy access
-        media[item.location] = item.get_url()
-        # Also store the object for access to alt_text and other fields
-        media[f"{item.location}_obj"] = item
-    
+    media = SimpleLazyObject(get_static_media)
     return {'media': media}
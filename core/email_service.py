@@ -6,58 +6,38 @@ primarily donation receipts after successful payments.
 """
 
 import logging
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+import time
+from smtplib import SMTPException
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template.loader import get_template
 from django.conf import settings
+from django.db import close_old_connections
 from django.utils import timezone
 
+from .models import Donation
+
 logger = logging.getLogger(__name__)
 
+# The receipt HTML is split so the invariant header/footer render only once;
+# emails/email_donation_receipt.html includes all three for previewing
+RECEIPT_HEADER_TEMPLATE_NAME = 'emails/receipt_header.html'
+RECEIPT_BODY_TEMPLATE_NAME = 'emails/receipt_body.html'
+RECEIPT_FOOTER_TEMPLATE_NAME = 'emails/receipt_footer.html'
 
-def send_donation_receipt(donation):
-    """
-    Send a donation receipt email to the donor.
-    
-    Args:
-        donation: Donation model instance with the following attributes:
-            - donor_name: Name of the donor
-            - donor_email: Email address of the donor
-            - amount: Donation amount
-            - transaction_id: Razorpay payment ID
-            - razorpay_order_id: Razorpay order ID
-            - date: Donation date
-    
-    Returns:
-        bool: True if email sent successfully, False otherwise
-    """
-    try:
-        # Prepare context for email template
-        context = {
-            'donor_name': donation.donor_name,
-            'amount': donation.amount,
-            'transaction_id': donation.transaction_id or 'N/A',
-            'order_id': donation.razorpay_order_id or 'N/A',
-            'donation_date': timezone.localtime(donation.date).strftime('%B %d, %Y at %I:%M %p'),
-        }
-        
-        # Subject line
-        subject = f'Thank You for Your Donation of ₹{donation.amount} - Amaanitvam Foundation'
-        
-        # Render HTML email template
-        html_content = render_to_string('emails/email_donation_receipt.html', context)
-        
-        # Create plain text version for email clients that don't support HTML
-        plain_text_content = f"""
-Dear {donation.donor_name},
-
-Thank you for your generous donation of ₹{donation.amount} to Amaanitvam Foundation!
+# Plain text receipt body, filled in with str.format() per donation
+RECEIPT_TEXT_TEMPLATE = """
+Dear {donor_name},
+
+Thank you for your generous donation of ₹{amount} to Amaanitvam Foundation!
 
 DONATION RECEIPT
 ================
-Amount: ₹{donation.amount}
-Transaction ID: {context['transaction_id']}
-Order ID: {context['order_id']}
-Date: {context['donation_date']}
+Amount: ₹{amount}
+Transaction ID: {transaction_id}
+Order ID: {order_id}
+Date: {donation_date}
 
 80G TAX EXEMPTION
 ================
@@ -75,35 +55,245 @@ Amaanitvam Foundation
 ---
 Email: amaanitvamfoundation@gmail.com
 Website: www.amaanitvamfoundation.org
-        """
-        
-        # Get donor email
-        donor_email = getattr(donation, 'donor_email', None)
-        if not donor_email:
-            logger.error(f"No donor email found for donation ID: {donation.id}")
-            return False
-        
-        # Create email message with both HTML and plain text versions
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=plain_text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[donor_email],
-            reply_to=['amaanitvamfoundation@gmail.com'],
+"""
+
+# Background delivery: attempts per receipt and initial retry delay (seconds)
+RECEIPT_MAX_ATTEMPTS = 3
+RECEIPT_RETRY_DELAY = 2
+
+# Small worker pool so SMTP round-trips don't block the payment views
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='receipt-email')
+
+# Compiled per-donation receipt template, loaded on first use
+_receipt_template = None
+
+# Rendered (header, footer) HTML shared by every receipt, built on first use
+_receipt_static_parts = None
+
+
+def _get_receipt_template():
+    """Return the compiled receipt body template, loading it only once per process."""
+    global _receipt_template
+    if _receipt_template is None:
+        _receipt_template = get_template(RECEIPT_BODY_TEMPLATE_NAME)
+    return _receipt_template
+
+
+def _get_receipt_static_parts():
+    """Return the rendered receipt header and footer, rendering them only once per process."""
+    global _receipt_static_parts
+    if _receipt_static_parts is None:
+        _receipt_static_parts = (
+            get_template(RECEIPT_HEADER_TEMPLATE_NAME).render(),
+            get_template(RECEIPT_FOOTER_TEMPLATE_NAME).render(),
         )
-        
-        # Attach HTML version
-        email.attach_alternative(html_content, "text/html")
-        
-        # Send the email
-        email.send(fail_silently=False)
-        
-        logger.info(f"Donation receipt email sent successfully to {donor_email} for donation ID: {donation.id}")
-        return True
-        
+    return _receipt_static_parts
+
+
+def _build_receipt_email(donation, connection=None):
+    """
+    Build the receipt message for a donation.
+    
+    Args:
+        donation: Donation model instance (see send_donation_receipt)
+        connection: Optional open email backend to send through
+    
+    Returns:
+        EmailMultiAlternatives, or None if the donation has no donor email
+    """
+    # Get donor email
+    donor_email = getattr(donation, 'donor_email', None)
+    if not donor_email:
+        logger.error(f"No donor email found for donation ID: {donation.id}")
+        return None
+    
+    # Prepare context for email template
+    context = {
+        'donor_name': donation.donor_name,
+        'amount': donation.amount,
+        'transaction_id': donation.transaction_id or 'N/A',
+        'order_id': donation.razorpay_order_id or 'N/A',
+        'donation_date': timezone.localtime(donation.date).strftime('%B %d, %Y at %I:%M %p'),
+    }
+    
+    # Subject line
+    subject = f'Thank You for Your Donation of ₹{donation.amount} - Amaanitvam Foundation'
+    
+    # Render HTML email: only the donation-specific middle needs the template engine
+    header_html, footer_html = _get_receipt_static_parts()
+    html_content = header_html + _get_receipt_template().render(context) + footer_html
+    
+    # Create plain text version for email clients that don't support HTML
+    plain_text_content = RECEIPT_TEXT_TEMPLATE.format(**context)
+    
+    # Create email message with both HTML and plain text versions
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=plain_text_content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[donor_email],
+        reply_to=['amaanitvamfoundation@gmail.com'],
+        connection=connection,
+    )
+    
+    # Attach HTML version
+    email.attach_alternative(html_content, "text/html")
+    return email
+
+
+def send_donation_receipt(donation):
+    """
+    Send a donation receipt email to the donor.
+    
+    Args:
+        donation: Donation model instance with the following attributes:
+            - donor_name: Name of the donor
+            - donor_email: Email address of the donor
+            - amount: Donation amount
+            - transaction_id: Razorpay payment ID
+            - razorpay_order_id: Razorpay order ID
+            - date: Donation date
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    try:
+        sent = _deliver_receipt(donation)
     except Exception as e:
         logger.error(f"Failed to send donation receipt email for donation ID: {donation.id}. Error: {str(e)}")
         return False
+    if sent:
+        _mark_receipts_sent([donation.pk])
+    return sent
+
+
+def _deliver_receipt(donation):
+    """
+    Build and send one receipt, letting send errors propagate.
+    
+    Delivery is not recorded here, so a database error afterwards can't be
+    mistaken for a failed send; callers use _mark_receipts_sent.
+    
+    Returns:
+        bool: True if sent, False if it can never be sent (no donor email)
+    
+    Raises:
+        SMTPException, OSError: Transient delivery failures worth retrying
+    """
+    email = _build_receipt_email(donation)
+    if email is None:
+        return False
+    
+    # Send the email
+    email.send(fail_silently=False)
+    
+    logger.info(f"Donation receipt email sent successfully to {donation.donor_email} for donation ID: {donation.id}")
+    return True
+
+
+def _mark_receipts_sent(donation_ids):
+    """
+    Record delivery so send_receipts doesn't email these donors again.
+    
+    The receipts have already gone out, so a database error is logged
+    rather than raised.
+    """
+    if not donation_ids:
+        return
+    try:
+        Donation.objects.filter(pk__in=donation_ids).update(receipt_sent_at=timezone.now())
+    except Exception as e:
+        logger.error(f"Donation receipts sent but failed to record delivery for donation IDs: {donation_ids}. Error: {str(e)}")
+
+
+def send_donation_receipts(donations):
+    """
+    Send receipts for several donations over a single SMTP connection.
+    
+    Opening one connection for the whole batch avoids a TCP/TLS handshake
+    and login per message. A failure on one receipt doesn't stop the rest.
+    
+    Args:
+        donations: Iterable of Donation model instances
+    
+    Returns:
+        int: Number of receipts sent successfully
+    """
+    donations = iter(donations)
+    first = next(donations, None)
+    if first is None:
+        # Nothing to send, so don't open an SMTP connection
+        return 0
+    
+    sent_ids = []
+    try:
+        with get_connection() as connection:
+            for donation in chain([first], donations):
+                try:
+                    email = _build_receipt_email(donation, connection=connection)
+                    if email is None:
+                        continue
+                    email.send(fail_silently=False)
+                    sent_ids.append(donation.pk)
+                    logger.info(f"Donation receipt email sent successfully to {donation.donor_email} for donation ID: {donation.id}")
+                except Exception as e:
+                    logger.error(f"Failed to send donation receipt email for donation ID: {donation.id}. Error: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to open email connection for batch receipts. Error: {str(e)}")
+    finally:
+        _mark_receipts_sent(sent_ids)
+    return len(sent_ids)
+
+
+def _send_donation_receipt_with_retries(donation):
+    """
+    Try to send a receipt up to RECEIPT_MAX_ATTEMPTS times with exponential backoff.
+    
+    Only transient SMTP/socket errors are retried; a receipt that can never be
+    sent (no donor email, template error) gives up straight away.
+    
+    Runs on an executor thread, so stale database connections are closed
+    before and after the same way Django does around each request.
+    """
+    close_old_connections()
+    try:
+        sent = _attempt_donation_receipt(donation)
+        if sent:
+            _mark_receipts_sent([donation.pk])
+        return sent
+    finally:
+        close_old_connections()
+
+
+def _attempt_donation_receipt(donation):
+    """Send one receipt, retrying transient failures; see _send_donation_receipt_with_retries."""
+    delay = RECEIPT_RETRY_DELAY
+    for attempt in range(1, RECEIPT_MAX_ATTEMPTS + 1):
+        try:
+            return _deliver_receipt(donation)
+        except (SMTPException, OSError) as e:
+            logger.warning(f"Attempt {attempt} to send donation receipt for donation ID: {donation.id} failed. Error: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to send donation receipt email for donation ID: {donation.id}. Error: {str(e)}")
+            return False
+        if attempt < RECEIPT_MAX_ATTEMPTS:
+            time.sleep(delay)
+            delay *= 2
+    logger.error(f"Giving up on donation receipt for donation ID: {donation.id} after {RECEIPT_MAX_ATTEMPTS} attempts")
+    return False
+
+
+def queue_donation_receipt(donation):
+    """
+    Send a donation receipt in a background thread so the caller returns immediately.
+    
+    Args:
+        donation: Donation model instance (see send_donation_receipt)
+    
+    Returns:
+        concurrent.futures.Future resolving to the final send result
+    """
+    return _email_executor.submit(_send_donation_receipt_with_retries, donation)
 
 
 def send_test_email(to_email):
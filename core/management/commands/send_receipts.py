@@ -0,0 +1,50 @@
+"""
+Management command to send donation receipts that haven't been delivered yet.
+Run with: python manage.py send_receipts --days 1
+Resend a specific receipt with: python manage.py send_receipts --id 42
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.email_service import send_donation_receipts
+from core.models import Donation
+
+
+class Command(BaseCommand):
+    help = 'Sends undelivered receipts for recent successful donations over one SMTP connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=1,
+            help='Send undelivered receipts for donations made in the last N days (default: 1)',
+        )
+        parser.add_argument(
+            '--id',
+            dest='donation_ids',
+            type=int,
+            action='append',
+            help='Resend the receipt for this donation ID, even if already sent (can be repeated)',
+        )
+
+    def handle(self, *args, **options):
+        donations = Donation.objects.filter(status='success')
+        if options['donation_ids']:
+            donations = donations.filter(id__in=options['donation_ids'])
+        else:
+            # Only donations whose receipt never went out (failed background send)
+            since = timezone.now() - timedelta(days=options['days'])
+            donations = donations.filter(date__gte=since, receipt_sent_at__isnull=True)
+
+        total = donations.count()
+        # Stream rows in chunks rather than loading every donation at once
+        sent_count = send_donation_receipts(donations.iterator(chunk_size=2000))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Sent {sent_count} of {total} donation receipts'
+            )
+        )
@@ -0,0 +1,36 @@
+"""
+Cached {location: url} map of active StaticMedia, shared by
+StaticMedia.get_media and the 'media' context processor.
+"""
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.core.cache import cache
+
+from .cache_keys import CONTEXT_CACHE_TIMEOUT, STATIC_MEDIA_CACHE_KEY
+
+
+def _build_static_media():
+    """Load every active StaticMedia row into a {location: url} dict."""
+    # Looked up through the app registry because core.models imports this module
+    StaticMedia = apps.get_model('core', 'StaticMedia')
+    media = {}
+    rows = StaticMedia.objects.filter(is_active=True).order_by().values_list(
+        'location', 'cached_url', 'alt_text', 'media_type'
+    )
+    for location, url, alt_text, media_type in rows:
+        # Store the URL for easy access (precomputed in StaticMedia.save)
+        media[location] = url or None
+        # Also store a lightweight object for access to alt_text and other fields
+        media[f"{location}_obj"] = SimpleNamespace(
+            location=location,
+            url=url or None,
+            alt_text=alt_text,
+            media_type=media_type,
+        )
+    return media
+
+
+def get_static_media():
+    """Return the cached {location: url} dict of active StaticMedia."""
+    return cache.get_or_set(STATIC_MEDIA_CACHE_KEY, _build_static_media, CONTEXT_CACHE_TIMEOUT)
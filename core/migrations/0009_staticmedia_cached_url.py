@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-15 00:12
+
+from django.db import migrations, models
+
+
+def fill_cached_url(apps, schema_editor):
+    """Populate cached_url for existing rows (mirrors StaticMedia.get_url)."""
+    StaticMedia = apps.get_model('core', 'StaticMedia')
+    for item in StaticMedia.objects.iterator(chunk_size=2000):
+        if item.media_type == 'video' and item.video:
+            url = item.video.url
+        elif item.image:
+            url = item.image.url
+        else:
+            url = ''
+        if url != item.cached_url:
+            item.cached_url = url
+            item.save(update_fields=['cached_url'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_add_donor_email_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='staticmedia',
+            name='cached_url',
+            field=models.CharField(blank=True, editable=False, help_text='URL of the active file, refreshed on save', max_length=500),
+        ),
+        migrations.RunPython(fill_cached_url, migrations.RunPython.noop),
+    ]
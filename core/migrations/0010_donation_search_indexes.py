@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-15 00:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_staticmedia_cached_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['transaction_id'], name='core_donati_transac_e25ee3_idx'),
+        ),
+    ]
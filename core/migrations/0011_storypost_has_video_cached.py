@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-15 00:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_donation_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storypost',
+            name='has_video_cached',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=models.Q(models.Q(('video_url__isnull', False), models.Q(('video_url', ''), _negated=True)), models.Q(('video_file__isnull', False), models.Q(('video_file', ''), _negated=True)), _connector='OR'), output_field=models.BooleanField(), verbose_name='Has Video'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-15 00:18
+
+from django.db import migrations, models
+
+
+def fill_amount_paise(apps, schema_editor):
+    """Populate amount_paise for existing donations."""
+    Donation = apps.get_model('core', 'Donation')
+    donations = list(Donation.objects.only('pk', 'amount'))
+    for donation in donations:
+        donation.amount_paise = int(donation.amount * 100)
+    Donation.objects.bulk_update(donations, ['amount_paise'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_storypost_has_video_cached'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donation',
+            name='amount_paise',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Amount in paise as sent to Razorpay, set on save'),
+        ),
+        migrations.RunPython(fill_amount_paise, migrations.RunPython.noop),
+    ]
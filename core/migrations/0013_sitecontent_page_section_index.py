@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-15 00:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_donation_amount_paise'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sitecontent',
+            index=models.Index(fields=['page', 'section', 'key'], name='core_siteco_page_48997f_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-15 00:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_sitecontent_page_section_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['-date'], name='core_donati_date_301d7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['status', '-date'], name='core_donati_status_514558_idx'),
+        ),
+    ]
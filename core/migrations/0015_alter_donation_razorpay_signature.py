@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-15 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_donation_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donation',
+            name='razorpay_signature',
+            field=models.CharField(blank=True, max_length=64, verbose_name='Razorpay Signature'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-15 00:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_alter_donation_razorpay_signature'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_active', '-created_at'], name='core_projec_is_acti_5333b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storypost',
+            index=models.Index(fields=['is_published', '-created_date'], name='core_storyp_is_publ_09499a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storypost',
+            index=models.Index(fields=['category', 'is_published', '-created_date'], name='core_storyp_categor_a31fd0_idx'),
+        ),
+    ]
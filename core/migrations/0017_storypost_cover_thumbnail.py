@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-15 00:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_storypost_project_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storypost',
+            name='cover_thumbnail',
+            field=models.ImageField(blank=True, editable=False, help_text='Downscaled WebP of the cover image for story cards, built on upload', null=True, upload_to='stories/thumbnails/'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-15 00:34
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_storypost_cover_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donation',
+            name='amount',
+            field=models.DecimalField(decimal_places=2, help_text='Amount in INR', max_digits=10, validators=[django.core.validators.MinValueValidator(10)]),
+        ),
+        migrations.AddConstraint(
+            model_name='donation',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gte', 10)), name='donation_amount_min'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-15 00:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_donation_amount_min'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donation',
+            name='receipt_sent_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the receipt email was delivered (empty = not sent yet)', null=True),
+        ),
+    ]
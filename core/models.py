@@ -1,6 +1,164 @@
+import logging
+from decimal import Decimal
+from functools import lru_cache
+from io import BytesIO
+from pathlib import PurePath
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.files.base import ContentFile
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.text import slugify
+from PIL import Image, ImageOps
+
+from .media_cache import get_static_media
+
+logger = logging.getLogger(__name__)
+
+
+# slugify() normalizes Unicode and runs regexes; titles repeat during imports
+_cached_slugify = lru_cache(maxsize=1024)(slugify)
+
+
+def bulk_create_with_slugs(model, objs, batch_size=500):
+    """
+    bulk_create StoryPost/Project objects, filling empty slugs from titles.
+    
+    Existing slugs are fetched in one query and clashes (with the table or
+    within the batch) get a -2, -3, ... suffix in Python, so the insert
+    doesn't fail on the unique slug constraint.
+    
+    Returns:
+        list: The created objects
+    """
+    objs = list(objs)
+    pending = [(obj, _cached_slugify(obj.title)) for obj in objs if not obj.slug]
+    if pending:
+        query = models.Q()
+        for base in {base for _, base in pending}:
+            query |= models.Q(slug__startswith=base)
+        taken = set(model.objects.filter(query).values_list('slug', flat=True))
+        taken.update(obj.slug for obj in objs if obj.slug)
+        for obj, base in pending:
+            slug, suffix = base, 2
+            while slug in taken:
+                slug = f"{base}-{suffix}"
+                suffix += 1
+            obj.slug = slug
+            taken.add(slug)
+    return model.objects.bulk_create(objs, batch_size=batch_size)
+
+
+def _bulk_add_images(model, parent_field, parent, files, batch_size=500):
+    """
+    bulk_create gallery images for a story/project in upload order.
+    
+    New images are ordered after the parent's existing ones, and the rows go in
+    as multi-row INSERTs of batch_size instead of one INSERT per file.
+    
+    Returns:
+        list: The created images
+    """
+    start = model.objects.filter(**{parent_field: parent}).aggregate(
+        next_order=models.Max('order') + 1
+    )['next_order'] or 0
+    objs = [
+        model(**{parent_field: parent}, image=image, order=start + i)
+        for i, image in enumerate(files)
+    ]
+    return model.objects.bulk_create(objs, batch_size=batch_size)
+
+
+def _youtube_embed(parts):
+    """youtube.com/watch?v=<id> -> YouTube embed URL."""
+    if parts.path != '/watch':
+        return None
+    video_id = parse_qs(parts.query).get('v', [''])[0]
+    return f"https://www.youtube.com/embed/{video_id}?autoplay=1&mute=1" if video_id else None
+
+
+def _youtu_be_embed(parts):
+    """youtu.be/<id> -> YouTube embed URL."""
+    video_id = parts.path.lstrip('/')
+    return f"https://www.youtube.com/embed/{video_id}?autoplay=1&mute=1" if video_id else None
+
+
+def _vimeo_embed(parts):
+    """vimeo.com/<id> -> Vimeo player URL."""
+    video_id = parts.path.lstrip('/')
+    return f"https://player.vimeo.com/video/{video_id}?autoplay=1&muted=1" if video_id else None
+
+
+def _vimeo_player_embed(parts):
+    """player.vimeo.com/video/<id> (already an embed link) -> Vimeo player URL."""
+    if not parts.path.startswith('/video/'):
+        return None
+    video_id = parts.path[len('/video/'):].strip('/')
+    return f"https://player.vimeo.com/video/{video_id}?autoplay=1&muted=1" if video_id else None
+
+
+# Embed URL builders keyed by video host
+_EMBED_HANDLERS = {
+    'youtube.com': _youtube_embed,
+    'www.youtube.com': _youtube_embed,
+    'm.youtube.com': _youtube_embed,
+    'youtu.be': _youtu_be_embed,
+    'vimeo.com': _vimeo_embed,
+    'www.vimeo.com': _vimeo_embed,
+    'player.vimeo.com': _vimeo_player_embed,
+}
+
+
+@lru_cache(maxsize=1024)
+def _embed_url_for(video_url):
+    """Return the autoplay embed URL for a YouTube/Vimeo link, or None."""
+    parts = urlsplit(video_url)
+    handler = _EMBED_HANDLERS.get(parts.netloc.lower())
+    
+    # Not a YouTube/Vimeo host (e.g. a direct video URL): no embed
+    if handler is None:
+        return None
+    return handler(parts)
+
+
+# Bounding box and quality for the WebP card thumbnails built on upload
+CARD_THUMBNAIL_SIZE = (800, 600)
+CARD_THUMBNAIL_QUALITY = 80
+
+
+def _webp_thumbnail(image_file, size=CARD_THUMBNAIL_SIZE):
+    """Return a downscaled WebP copy of an uploaded image as a ContentFile."""
+    image_file.seek(0)
+    with Image.open(image_file) as image:
+        # Apply the EXIF orientation, since the WebP doesn't carry it over
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(size)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+        buffer = BytesIO()
+        image.save(buffer, format='WEBP', quality=CARD_THUMBNAIL_QUALITY)
+    image_file.seek(0)
+    return ContentFile(buffer.getvalue())
+
+
+class StoryPostManager(models.Manager):
+    """Manager for StoryPost with a trimmed queryset for story cards."""
+
+    # Columns the story card templates read
+    LIST_FIELDS = (
+        'title', 'slug', 'category', 'cover_image', 'cover_thumbnail',
+        'created_date', 'is_published', 'has_video_cached',
+    )
+
+    def for_list(self, with_body=False):
+        """
+        Load only the columns story cards need, leaving out the large body
+        unless the cards render an excerpt from it.
+        """
+        fields = self.LIST_FIELDS + ('body',) if with_body else self.LIST_FIELDS
+        return self.only(*fields)
 
 
 class StoryPost(models.Model):
@@ -23,6 +181,13 @@ class StoryPost(models.Model):
         null=True,
         help_text="Cover image for the story"
     )
+    cover_thumbnail = models.ImageField(
+        upload_to='stories/thumbnails/',
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Downscaled WebP of the cover image for story cards, built on upload"
+    )
     video_url = models.URLField(
         blank=True,
         null=True,
@@ -43,52 +208,74 @@ class StoryPost(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
+    # Stored copy of has_video so the admin can filter and list it in SQL
+    has_video_cached = models.GeneratedField(
+        expression=(
+            (models.Q(video_url__isnull=False) & ~models.Q(video_url=''))
+            | (models.Q(video_file__isnull=False) & ~models.Q(video_file=''))
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        db_index=True,
+        verbose_name="Has Video",
+    )
+
+    objects = StoryPostManager()
 
     class Meta:
         ordering = ['-created_date']
         verbose_name = "Story Post"
         verbose_name_plural = "Story Posts"
+        indexes = [
+            # Published listings (home, stories) and category-filtered/related stories
+            models.Index(fields=['is_published', '-created_date']),
+            models.Index(fields=['category', 'is_published', '-created_date']),
+        ]
 
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
+            self.slug = _cached_slugify(self.title)
+            # Partial saves (update_fields) must still write the generated slug
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'slug' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'slug']
+        
+        # Rebuild the card thumbnail when a new cover is uploaded, and drop
+        # the old thumbnail file when the cover is replaced or cleared
+        new_cover = bool(self.cover_image) and not self.cover_image._committed
+        if (new_cover or not self.cover_image) and self.cover_thumbnail:
+            self.cover_thumbnail.delete(save=False)
+        if new_cover:
+            name = f"{PurePath(self.cover_image.name).stem}.webp"
+            try:
+                self.cover_thumbnail.save(name, _webp_thumbnail(self.cover_image), save=False)
+            except OSError as e:
+                logger.error(f"Failed to build cover thumbnail for story '{self.title}'. Error: {str(e)}")
+                self.cover_thumbnail = None
+        elif not self.cover_image:
+            self.cover_thumbnail = None
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         return reverse('story_detail', kwargs={'slug': self.slug})
 
+    @cached_property
     def has_video(self):
         """Check if the story has any video content."""
         return bool(self.video_url or self.video_file)
 
-    def get_embed_url(self):
+    @cached_property
+    def embed_url(self):
         """
         Convert YouTube/Vimeo URLs to embed format for autoplay.
         Returns None if video_file is used instead.
         """
         if not self.video_url:
             return None
-        
-        url = self.video_url
-        
-        # YouTube handling
-        if 'youtube.com/watch' in url:
-            video_id = url.split('v=')[1].split('&')[0]
-            return f"https://www.youtube.com/embed/{video_id}?autoplay=1&mute=1"
-        elif 'youtu.be/' in url:
-            video_id = url.split('youtu.be/')[1].split('?')[0]
-            return f"https://www.youtube.com/embed/{video_id}?autoplay=1&mute=1"
-        
-        # Vimeo handling
-        elif 'vimeo.com/' in url:
-            video_id = url.split('vimeo.com/')[1].split('?')[0]
-            return f"https://player.vimeo.com/video/{video_id}?autoplay=1&muted=1"
-        
-        # Direct video URL - use HTML5 player
-        return None
+        return _embed_url_for(self.video_url)
 
 
 class StoryImage(models.Model):
@@ -123,6 +310,15 @@ class StoryImage(models.Model):
     def __str__(self):
         return f"Image {self.order + 1} for {self.story.title}"
 
+    @classmethod
+    def bulk_add(cls, story, files, batch_size=500):
+        """Add several uploaded images to a story in batched INSERTs."""
+        return _bulk_add_images(cls, 'story', story, files, batch_size)
+
+
+# Smallest donation accepted, in INR
+MIN_DONATION_AMOUNT = 10
+
 
 class Donation(models.Model):
     """
@@ -141,12 +337,22 @@ class Donation(models.Model):
     donor_phone = models.CharField(max_length=15, blank=True, verbose_name="Donor Phone")
     
     # Donation Details
-    amount = models.DecimalField(max_digits=10, decimal_places=2, help_text="Amount in INR")
+    amount = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        validators=[MinValueValidator(MIN_DONATION_AMOUNT)],
+        help_text="Amount in INR"
+    )
+    amount_paise = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Amount in paise as sent to Razorpay, set on save"
+    )
     
     # Razorpay Details
     razorpay_order_id = models.CharField(max_length=100, unique=True, verbose_name="Razorpay Order ID")
     transaction_id = models.CharField(max_length=100, blank=True, verbose_name="Payment ID")
-    razorpay_signature = models.CharField(max_length=255, blank=True, verbose_name="Razorpay Signature")
+    razorpay_signature = models.CharField(max_length=64, blank=True, verbose_name="Razorpay Signature")
     
     # Status
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
@@ -154,16 +360,44 @@ class Donation(models.Model):
     # Timestamps
     date = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    receipt_sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="When the receipt email was delivered (empty = not sent yet)"
+    )
 
     class Meta:
         ordering = ['-date']
         verbose_name = "Donation"
         verbose_name_plural = "Donations"
+        indexes = [
+            # Exact payment ID lookups from the admin search (DonationAdmin)
+            models.Index(fields=['transaction_id']),
+            # Default -date ordering, and status filters (admin, send_receipts)
+            models.Index(fields=['-date']),
+            models.Index(fields=['status', '-date']),
+        ]
+        constraints = [
+            # Same minimum the donation views enforce, so no row can bypass it
+            models.CheckConstraint(
+                condition=models.Q(amount__gte=MIN_DONATION_AMOUNT),
+                name='donation_amount_min',
+            ),
+        ]
 
     def __str__(self):
         status_display = self.get_status_display()
         return f"{self.donor_name} - ₹{self.amount} ({status_display})"
 
+    def save(self, *args, **kwargs):
+        # Keep the Razorpay amount in step with amount (editable in the admin)
+        self.amount_paise = int(Decimal(str(self.amount)).scaleb(2))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'amount' in update_fields and 'amount_paise' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'amount_paise']
+        super().save(*args, **kwargs)
+
 
 class VolunteerFormLink(models.Model):
     """
@@ -262,6 +496,10 @@ class SiteContent(models.Model):
         verbose_name = "Site Content"
         verbose_name_plural = "Site Content"
         ordering = ['page', 'section', 'key']
+        indexes = [
+            # Matches the admin's page filter and page/section/key ordering
+            models.Index(fields=['page', 'section', 'key']),
+        ]
     
     def __str__(self):
         return f"{self.label} ({self.page})"
@@ -337,13 +575,16 @@ class Project(models.Model):
         ordering = ['-created_at']
         verbose_name = "Project"
         verbose_name_plural = "Projects"
+        indexes = [
+            models.Index(fields=['is_active', '-created_at']),
+        ]
     
     def __str__(self):
         return self.title
     
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
+            self.slug = _cached_slugify(self.title)
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
@@ -384,6 +625,11 @@ class ProjectImage(models.Model):
     
     def __str__(self):
         return f"Image {self.order + 1} for {self.project.title}"
+    
+    @classmethod
+    def bulk_add(cls, project, files, batch_size=500):
+        """Add several uploaded images to a project in batched INSERTs."""
+        return _bulk_add_images(cls, 'project', project, files, batch_size)
 
 
 class ProjectUpdate(models.Model):
@@ -490,6 +736,12 @@ class StaticMedia(models.Model):
         default=True,
         help_text="When inactive, fallback/default media will be used"
     )
+    cached_url = models.CharField(
+        max_length=500,
+        blank=True,
+        editable=False,
+        help_text="URL of the active file, refreshed on save"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -506,16 +758,15 @@ class StaticMedia(models.Model):
     def save(self, *args, **kwargs):
         # Delete old files when updating with new ones
         if self.pk:
-            try:
-                old_instance = StaticMedia.objects.get(pk=self.pk)
+            # Only the file columns are needed to compare against
+            old_instance = StaticMedia.objects.filter(pk=self.pk).only('image', 'video').first()
+            if old_instance is not None:
                 # Check if image is being replaced
                 if old_instance.image and self.image and old_instance.image != self.image:
                     old_instance.image.delete(save=False)
                 # Check if video is being replaced
                 if old_instance.video and self.video and old_instance.video != self.video:
                     old_instance.video.delete(save=False)
-            except StaticMedia.DoesNotExist:
-                pass
         
         # Auto-fill key from location if not set
         if self.location and not self.key:
@@ -523,6 +774,12 @@ class StaticMedia(models.Model):
         # Auto-fill label from location display name
         if self.location and not self.label:
             self.label = self.get_location_display()
+        # Commit pending uploads now (as FileField.pre_save would) so the
+        # stored name, and therefore the URL, is final before caching it
+        for file in (self.image, self.video):
+            if file and not file._committed:
+                file.save(file.name, file.file, save=False)
+        self.cached_url = self.get_url() or ''
         super().save(*args, **kwargs)
     
     def get_url(self):
@@ -536,8 +793,6 @@ class StaticMedia(models.Model):
     @classmethod
     def get_media(cls, location_key):
         """Get active media for a specific location."""
-        try:
-            media = cls.objects.get(location=location_key, is_active=True)
-            return media.get_url()
-        except cls.DoesNotExist:
-            return None
+        # Served from the cached location -> URL map shared with the 'media'
+        # context processor (invalidated in core.signals)
+        return get_static_media().get(location_key)
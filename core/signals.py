@@ -0,0 +1,38 @@
+"""
+Signal handlers that keep cached site data in sync with the database.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache_keys import (
+    SITE_CONTENT_CACHE_KEY,
+    STATIC_MEDIA_CACHE_KEY,
+    STORY_CARDS_VERSION_CACHE_KEY,
+    VOLUNTEER_LINK_CACHE_KEY,
+)
+from .models import SiteContent, StaticMedia, StoryPost, VolunteerFormLink
+
+
+@receiver([post_save, post_delete], sender=SiteContent)
+def invalidate_site_content(sender, **kwargs):
+    """Drop the cached 'site' context so the next render rebuilds it."""
+    cache.delete(SITE_CONTENT_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=StaticMedia)
+def invalidate_static_media(sender, **kwargs):
+    """Drop the cached 'media' context so the next render rebuilds it."""
+    cache.delete(STATIC_MEDIA_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=StoryPost)
+def invalidate_story_cards(sender, **kwargs):
+    """Drop the story card version so cached fragments are re-rendered."""
+    cache.delete(STORY_CARDS_VERSION_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=VolunteerFormLink)
+def invalidate_volunteer_link(sender, **kwargs):
+    """Drop the cached volunteer link so ways-to-help picks up the change."""
+    cache.delete(VOLUNTEER_LINK_CACHE_KEY)
@@ -1,3 +1,245 @@
-from django.test import TestCase
+import hashlib
+import hmac
+import json
+from unittest import mock
 
-# Create your tests here.
+import razorpay
+from django.core import mail
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import email_service, views
+from .models import Donation, _embed_url_for
+
+
+TEST_KEY_SECRET = 'test-key-secret'
+
+
+def _sign(order_id, payment_id, secret=TEST_KEY_SECRET):
+    """Checkout signature as Razorpay computes it."""
+    message = f"{order_id}|{payment_id}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+@override_settings(RAZORPAY_KEY_ID='rzp_test_key', RAZORPAY_KEY_SECRET=TEST_KEY_SECRET)
+class PaymentSignatureTests(TestCase):
+    """_payment_signature_valid must agree with the Razorpay SDK."""
+
+    def setUp(self):
+        self.sdk = razorpay.Client(auth=('rzp_test_key', TEST_KEY_SECRET))
+        self.params = {
+            'razorpay_order_id': 'order_ABC123',
+            'razorpay_payment_id': 'pay_XYZ789',
+            'razorpay_signature': _sign('order_ABC123', 'pay_XYZ789'),
+        }
+
+    def test_valid_signature(self):
+        self.assertTrue(self.sdk.utility.verify_payment_signature(self.params))
+        self.assertTrue(views._payment_signature_valid(self.params))
+
+    def test_tampered_signatures(self):
+        tampered = [
+            {**self.params, 'razorpay_signature': '0' * 64},
+            {**self.params, 'razorpay_payment_id': 'pay_OTHER'},
+            {**self.params, 'razorpay_order_id': 'order_OTHER'},
+            {**self.params, 'razorpay_signature': _sign('order_ABC123', 'pay_XYZ789', 'wrong-secret')},
+        ]
+        for params in tampered:
+            with self.subTest(params=params):
+                with self.assertRaises(razorpay.errors.SignatureVerificationError):
+                    self.sdk.utility.verify_payment_signature(params)
+                self.assertFalse(views._payment_signature_valid(params))
+
+
+@override_settings(RAZORPAY_KEY_ID='rzp_test_key', RAZORPAY_KEY_SECRET=TEST_KEY_SECRET, RATELIMIT_ENABLE=False)
+class PaymentViewTests(TestCase):
+    """Success, failure and retry paths of payment_callback and verify_payment."""
+
+    order_id = 'order_TEST1'
+    payment_id = 'pay_TEST1'
+
+    def setUp(self):
+        cache.clear()
+        self.donation = Donation.objects.create(
+            donor_name='Test Donor',
+            donor_email='donor@example.com',
+            amount=100,
+            razorpay_order_id=self.order_id,
+        )
+        receipt_patcher = mock.patch.object(views, 'queue_donation_receipt')
+        self.queue_receipt = receipt_patcher.start()
+        self.addCleanup(receipt_patcher.stop)
+        self.razorpay = mock.MagicMock()
+        self.razorpay.payment.fetch.return_value = {'amount': 10000}
+        client_patcher = mock.patch.object(views, 'get_razorpay_client', return_value=self.razorpay)
+        client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+
+    def _post(self, url_name, signature=None, **overrides):
+        body = {
+            'razorpay_order_id': self.order_id,
+            'razorpay_payment_id': self.payment_id,
+            'razorpay_signature': signature or _sign(self.order_id, self.payment_id),
+            **overrides,
+        }
+        return self.client.post(reverse(url_name), json.dumps(body), content_type='application/json')
+
+    def test_callback_success(self):
+        response = self._post('payment_callback')
+        self.assertEqual(response.json(), {'status': 'success', 'donation_id': self.donation.id})
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, 'success')
+        self.assertEqual(self.donation.transaction_id, self.payment_id)
+        self.queue_receipt.assert_called_once()
+
+    def test_callback_bad_signature_marks_failed(self):
+        response = self._post('payment_callback', signature='0' * 64)
+        self.assertEqual(response.json()['status'], 'failed')
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, 'failed')
+        self.queue_receipt.assert_not_called()
+
+    def test_callback_bad_signature_keeps_paid_donation(self):
+        self._post('payment_callback')
+        self._post('payment_callback', signature='0' * 64)
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, 'success')
+
+    def test_callback_bad_signature_unknown_order(self):
+        response = self._post('payment_callback', signature='0' * 64, razorpay_order_id='order_MISSING')
+        self.assertEqual(response.json()['status'], 'error')
+
+    def test_callback_retry_sends_one_receipt(self):
+        first = self._post('payment_callback')
+        retry = self._post('payment_callback')
+        self.assertEqual(first.json(), retry.json())
+        self.queue_receipt.assert_called_once()
+
+    def test_callback_missing_fields(self):
+        response = self.client.post(
+            reverse('payment_callback'), json.dumps({'razorpay_order_id': self.order_id}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.json()['status'], 'error')
+
+    def test_verify_success(self):
+        response = self._post('verify_payment')
+        self.assertEqual(response.json(), {'status': 'success'})
+        self.razorpay.payment.fetch.assert_called_once_with(self.payment_id)
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, 'success')
+        self.queue_receipt.assert_called_once()
+
+    def test_verify_bad_signature(self):
+        response = self._post('verify_payment', signature='0' * 64)
+        self.assertEqual(response.status_code, 400)
+        self.razorpay.payment.fetch.assert_not_called()
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, 'pending')
+
+    def test_verify_amount_mismatch(self):
+        self.razorpay.payment.fetch.return_value = {'amount': 100}
+        response = self._post('verify_payment')
+        self.assertEqual(response.status_code, 400)
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, 'pending')
+        self.queue_receipt.assert_not_called()
+
+    def test_verify_retry_skips_fetch_and_receipt(self):
+        self._post('verify_payment')
+        response = self._post('verify_payment')
+        self.assertEqual(response.json(), {'status': 'success'})
+        self.razorpay.payment.fetch.assert_called_once()
+        self.queue_receipt.assert_called_once()
+
+    def test_verify_unknown_order(self):
+        response = self._post(
+            'verify_payment',
+            signature=_sign('order_MISSING', self.payment_id),
+            razorpay_order_id='order_MISSING',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Order not found')
+
+
+class DonationAmountPaiseTests(TestCase):
+    """amount_paise must follow amount, including edits made after creation."""
+
+    def test_amount_paise_tracks_amount(self):
+        donation = Donation.objects.create(donor_name='Test Donor', donor_email='donor@example.com', amount='250.50')
+        self.assertEqual(donation.amount_paise, 25050)
+        donation.amount = 300
+        donation.save(update_fields=['amount'])
+        donation.refresh_from_db()
+        self.assertEqual(donation.amount_paise, 30000)
+
+
+class ReceiptDeliveryTests(TestCase):
+    """Background receipts report delivery separately from recording it."""
+
+    def setUp(self):
+        self.donation = Donation.objects.create(
+            donor_name='Test Donor',
+            donor_email='donor@example.com',
+            amount=100,
+            transaction_id='pay_TEST1',
+            status='success',
+        )
+
+    def test_records_delivery(self):
+        self.assertTrue(email_service._send_donation_receipt_with_retries(self.donation))
+        self.assertEqual(len(mail.outbox), 1)
+        self.donation.refresh_from_db()
+        self.assertIsNotNone(self.donation.receipt_sent_at)
+
+    def test_delivered_receipt_not_reported_failed_when_recording_fails(self):
+        with mock.patch.object(email_service.Donation.objects, 'filter', side_effect=DatabaseError('locked')):
+            self.assertTrue(email_service._send_donation_receipt_with_retries(self.donation))
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class StoriesListTests(TestCase):
+    """Query parameters are normalised before they reach the grid's cache key."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_normalises_page_and_category(self):
+        for query, page, category in [
+            ({}, 1, None),
+            ({'page': 'abc'}, 1, None),
+            ({'page': '-3'}, 1, None),
+            ({'page': '2'}, 2, None),
+            ({'category': 'not-a-category'}, 1, None),
+        ]:
+            with self.subTest(query=query):
+                response = self.client.get(reverse('stories_list'), query)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.context['page_number'], page)
+                self.assertEqual(response.context['selected_category'], category)
+
+
+class EmbedUrlTests(TestCase):
+    """_embed_url_for turns supported video links into autoplay embed URLs."""
+
+    def test_supported_hosts(self):
+        cases = {
+            'https://www.youtube.com/watch?v=abc123&list=PL1&t=42s':
+                'https://www.youtube.com/embed/abc123?autoplay=1&mute=1',
+            'https://youtu.be/abc123?t=42':
+                'https://www.youtube.com/embed/abc123?autoplay=1&mute=1',
+            'https://m.youtube.com/watch?v=abc123':
+                'https://www.youtube.com/embed/abc123?autoplay=1&mute=1',
+            'https://vimeo.com/76979871':
+                'https://player.vimeo.com/video/76979871?autoplay=1&muted=1',
+            'https://player.vimeo.com/video/76979871?h=abc':
+                'https://player.vimeo.com/video/76979871?autoplay=1&muted=1',
+        }
+        for video_url, embed_url in cases.items():
+            with self.subTest(video_url=video_url):
+                self.assertEqual(_embed_url_for(video_url), embed_url)
+
+    def test_unknown_host(self):
+        self.assertIsNone(_embed_url_for('https://example.com/media/story.mp4'))
@@ -1,42 +1,168 @@
+from decimal import Decimal, InvalidOperation, ROUND_DOWN
+from functools import lru_cache
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.http import JsonResponse, HttpResponse
+from django.views.decorators.cache import cache_control, cache_page
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from django_ratelimit.decorators import ratelimit
 import razorpay
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import hmac
 import json
+import time
+
+from .models import (
+    MIN_DONATION_AMOUNT,
+    Donation,
+    Project,
+    ProjectImage,
+    ProjectUpdate,
+    StoryPost,
+    VolunteerFormLink,
+)
+from .email_service import queue_donation_receipt
+from .cache_keys import (
+    STORY_CARDS_FRAGMENT_TIMEOUT,
+    STORY_CARDS_VERSION_CACHE_KEY,
+    VOLUNTEER_LINK_CACHE_KEY,
+    VOLUNTEER_LINK_CACHE_TIMEOUT,
+)
 
-from .models import StoryPost, Donation, VolunteerFormLink, Project
-from .email_service import send_donation_receipt
 
+# Razorpay payment amounts, keyed by payment ID (see _payment_amount_paise)
+PAYMENT_AMOUNT_CACHE_PREFIX = 'core:razorpay_payment_amount:'
+PAYMENT_AMOUNT_CACHE_TIMEOUT = 60
+
+# Story cards per page on the stories list
+STORIES_PER_PAGE = 24
+
+# Homepage impact metrics (these can be made dynamic later; if so, compute them
+# on a schedule or cache them rather than aggregating on every home() hit)
+IMPACT_METRICS = {
+    'children_helped': 5000,
+    'meals_served': 25000,
+    'schools_supported': 15,
+}
+
+
+def static_page(view):
+    """Cache a static page's whole response server-side and in browsers/CDNs."""
+    timeout = settings.STATIC_PAGE_CACHE_TIMEOUT
+    return cache_control(public=True, max_age=timeout)(cache_page(timeout)(view))
+
+
+class _RazorpaySession(requests.Session):
+    """Keep-alive HTTP session that applies RAZORPAY_TIMEOUT to every call."""
+
+    def __init__(self):
+        super().__init__()
+        # Enough pooled connections for threaded workers; retry idempotent
+        # calls (payment.fetch) on gateway errors. POSTs are never retried,
+        # so an order can't be created twice.
+        self.mount('https://', HTTPAdapter(
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        ))
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault('timeout', settings.RAZORPAY_TIMEOUT)
+        return super().request(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_razorpay_client():
+    """Build the Razorpay client on first use, so pages that never pay don't."""
+    return razorpay.Client(
+        session=_RazorpaySession(),
+        auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET)
+    )
+
+
+def _razorpay_params(request):
+    """
+    Parse a Razorpay checkout POST body into the signature params dict.
+    
+    Raises:
+        ValueError: Body isn't valid JSON
+        KeyError: A required razorpay_* field is missing
+        TypeError: Body isn't a JSON object
+    """
+    data = json.loads(request.body)
+    params = {
+        'razorpay_order_id': data['razorpay_order_id'],
+        'razorpay_payment_id': data['razorpay_payment_id'],
+        'razorpay_signature': data['razorpay_signature'],
+    }
+    if not all(isinstance(value, str) for value in params.values()):
+        raise TypeError('Razorpay fields must be strings')
+    return params
 
-# Initialize Razorpay client
-razorpay_client = razorpay.Client(
-    auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET)
-)
 
+def _payment_signature_valid(params):
+    """
+    Check a checkout signature: HMAC-SHA256 of "order_id|payment_id" with the key secret.
+    
+    Same check as razorpay's utility.verify_payment_signature, but returns a
+    bool so a failed payment isn't handled through an exception.
+    """
+    message = f"{params['razorpay_order_id']}|{params['razorpay_payment_id']}"
+    expected = hmac.new(
+        settings.RAZORPAY_KEY_SECRET.encode(), message.encode(), hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(expected.encode(), params['razorpay_signature'].encode())
 
+
+def _payment_amount_paise(payment_id):
+    """
+    Amount in paise of a Razorpay payment, cached briefly per payment ID.
+    
+    A payment's amount never changes, so retries within the window skip the
+    outbound payment.fetch call.
+    """
+    return cache.get_or_set(
+        f'{PAYMENT_AMOUNT_CACHE_PREFIX}{payment_id}',
+        lambda: get_razorpay_client().payment.fetch(payment_id)['amount'],
+        PAYMENT_AMOUNT_CACHE_TIMEOUT,
+    )
+
+
+def _story_cards_context():
+    """Cache settings for the {% cache %} story card fragments."""
+    return {
+        'story_cards_timeout': STORY_CARDS_FRAGMENT_TIMEOUT,
+        # New token after any StoryPost save/delete (see core.signals)
+        'story_cards_version': cache.get_or_set(STORY_CARDS_VERSION_CACHE_KEY, time.time_ns, None),
+    }
+
+
+@cache_control(public=True, s_maxage=60)
 def home(request):
     """
     Homepage with hero section, impact metrics, and latest stories.
     """
     # Get latest 3 published stories for the homepage
-    latest_stories = StoryPost.objects.filter(is_published=True)[:3]
-    
-    # Impact metrics (these can be made dynamic later)
-    impact_metrics = {
-        'children_helped': 5000,
-        'meals_served': 25000,
-        'schools_supported': 15,
-    }
+    latest_stories = StoryPost.objects.for_list(with_body=True).filter(is_published=True)[:3]
     
     context = {
         'latest_stories': latest_stories,
-        'impact_metrics': impact_metrics,
+        'impact_metrics': IMPACT_METRICS,
+        **_story_cards_context(),
     }
     return render(request, 'home.html', context)
 
 
+@static_page
 def about(request):
     """
     About page with foundation information.
@@ -49,7 +175,16 @@ def what_we_do(request):
     What We Do page - details about programs and initiatives.
     """
     # Get active projects with their latest updates
-    projects = Project.objects.filter(is_active=True).prefetch_related('images', 'updates')
+    # Cards show the short description only, so skip the long one
+    # and only load the image and update columns the cards display
+    projects = (
+        Project.objects.filter(is_active=True)
+        .defer('full_description')
+        .prefetch_related(
+            Prefetch('images', queryset=ProjectImage.objects.only('project_id', 'image', 'caption')),
+            Prefetch('updates', queryset=ProjectUpdate.objects.only('project_id', 'date')),
+        )
+    )
     
     context = {
         'projects': projects,
@@ -61,8 +196,13 @@ def project_detail(request, slug):
     """
     Project detail page - shows all images and updates for a project.
     """
-    project = get_object_or_404(Project, slug=slug, is_active=True)
+    project = get_object_or_404(
+        Project.objects.prefetch_related('images', 'updates'),
+        slug=slug,
+        is_active=True,
+    )
     
+    # Both querysets come from the prefetch cache, not new queries
     context = {
         'project': project,
         'images': project.images.all(),
@@ -71,31 +211,38 @@ def project_detail(request, slug):
     return render(request, 'project_detail.html', context)
 
 
-def ways_to_help(request):
-    """
-    Ways to Help page - different ways to contribute.
-    Includes volunteer form link functionality.
-    """
-    # Get active volunteer form link
-    volunteer_link = VolunteerFormLink.get_active_link()
+def _volunteer_link_context():
+    """Volunteer form URL, status and disclaimer for the ways-to-help page."""
+    # Most recent active link, else the most recent entry (for its disclaimer)
+    volunteer_link = VolunteerFormLink.objects.order_by('-is_active', '-updated_at').first()
     
     # Get disclaimer message (from most recent entry or default)
-    if volunteer_link:
+    if volunteer_link and volunteer_link.is_active:
         disclaimer_message = volunteer_link.disclaimer_message
         volunteer_form_url = volunteer_link.form_url
         volunteer_active = True
     else:
-        # Check if there's any entry to get the disclaimer from
-        any_link = VolunteerFormLink.objects.first()
-        disclaimer_message = any_link.disclaimer_message if any_link else "Volunteer recruitment is currently closed. Please check back later or follow us on social media for updates."
+        disclaimer_message = volunteer_link.disclaimer_message if volunteer_link else "Volunteer recruitment is currently closed. Please check back later or follow us on social media for updates."
         volunteer_form_url = None
         volunteer_active = False
     
-    context = {
+    return {
         'volunteer_form_url': volunteer_form_url,
         'volunteer_active': volunteer_active,
         'disclaimer_message': disclaimer_message,
     }
+
+
+@cache_control(public=True, s_maxage=VOLUNTEER_LINK_CACHE_TIMEOUT)
+def ways_to_help(request):
+    """
+    Ways to Help page - different ways to contribute.
+    Includes volunteer form link functionality.
+    """
+    # The link rarely changes; core.signals clears the cache when it does
+    context = cache.get_or_set(
+        VOLUNTEER_LINK_CACHE_KEY, _volunteer_link_context, VOLUNTEER_LINK_CACHE_TIMEOUT
+    )
     return render(request, 'ways_to_help.html', context)
 
 
@@ -103,17 +250,33 @@ def stories_list(request):
     """
     Grid layout of all published stories.
     """
-    stories = StoryPost.objects.filter(is_published=True)
+    stories = StoryPost.objects.for_list(with_body=True).filter(is_published=True)
     
-    # Filter by category if provided
+    # Filter by category if provided; unknown values show every story so
+    # they can't add entries to the cached grid
     category = request.GET.get('category')
+    if category not in dict(StoryPost.CATEGORY_CHOICES):
+        category = None
     if category:
         stories = stories.filter(category=category)
     
+    # Normalised for the same reason; Paginator.get_page clamps the rest
+    try:
+        page_number = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page_number = 1
+    
+    # Lazy so the count and page queries only run when the cached grid misses
+    page_obj = SimpleLazyObject(
+        lambda: Paginator(stories, STORIES_PER_PAGE).get_page(page_number)
+    )
+    
     context = {
-        'stories': stories,
+        'page_obj': page_obj,
+        'page_number': page_number,
         'categories': StoryPost.CATEGORY_CHOICES,
         'selected_category': category,
+        **_story_cards_context(),
     }
     return render(request, 'stories_list.html', context)
 
@@ -122,10 +285,16 @@ def story_detail(request, slug):
     """
     Individual story page with video autoplay support.
     """
-    story = get_object_or_404(StoryPost, slug=slug, is_published=True)
+    # The template reads story.images.all twice; prefetch it into one query
+    story = get_object_or_404(
+        StoryPost.objects.prefetch_related('images'),
+        slug=slug,
+        is_published=True,
+    )
     
-    # Get related stories (same category, excluding current)
-    related_stories = StoryPost.objects.filter(
+    # Get related stories (same category, excluding current); the query is
+    # lazy, so it only runs when the cached related-stories fragment misses
+    related_stories = StoryPost.objects.for_list().filter(
         category=story.category,
         is_published=True
     ).exclude(id=story.id)[:3]
@@ -133,6 +302,7 @@ def story_detail(request, slug):
     context = {
         'story': story,
         'related_stories': related_stories,
+        **_story_cards_context(),
     }
     return render(request, 'story_detail.html', context)
 
@@ -141,6 +311,8 @@ def story_detail(request, slug):
 def donate(request):
     """
     Donation page with Razorpay integration.
+    Keep database work out of the Razorpay API call so no transaction
+    stays open across the network round trip.
     """
     if request.method == 'POST':
         # Get form data
@@ -149,16 +321,17 @@ def donate(request):
         donor_phone = request.POST.get('donor_phone')
         amount = request.POST.get('amount')
         
-        # Input validation: reject amounts less than 10
+        # Input validation: parse once as Decimal (no float rounding on money)
+        # and reject amounts below the minimum
         try:
-            if int(float(amount)) < 10:
-                return HttpResponse("Minimum donation is ₹10", status=400)
-        except (ValueError, TypeError):
+            amount_decimal = Decimal(amount).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
+            if amount_decimal < MIN_DONATION_AMOUNT:
+                return HttpResponse(f"Minimum donation is ₹{MIN_DONATION_AMOUNT}", status=400)
+        except (InvalidOperation, TypeError):
             return HttpResponse("Invalid Amount", status=400)
         
         try:
-            amount_decimal = float(amount)
-            amount_paise = int(amount_decimal * 100)
+            amount_paise = int(amount_decimal.scaleb(2))
             
             # Create Razorpay order
             order_data = {
@@ -167,7 +340,7 @@ def donate(request):
                 'receipt': f'donation_{donor_email}',
                 'payment_capture': 1  # Auto capture
             }
-            razorpay_order = razorpay_client.order.create(order_data)
+            razorpay_order = get_razorpay_client().order.create(order_data)
             
             # Create donation record with pending status
             donation = Donation.objects.create(
@@ -211,50 +384,56 @@ def payment_callback(request):
     """
     Handle Razorpay payment callback and verify signature.
     Rate limited to 10 requests per minute per IP.
+    The donation update runs in a short transaction after verification.
     """
     if request.method == 'POST':
         try:
-            data = json.loads(request.body)
-            
-            razorpay_order_id = data.get('razorpay_order_id')
-            razorpay_payment_id = data.get('razorpay_payment_id')
-            razorpay_signature = data.get('razorpay_signature')
+            params_dict = _razorpay_params(request)
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({'status': 'error', 'error': 'Missing or invalid payment details'})
+        
+        try:
+            razorpay_order_id = params_dict['razorpay_order_id']
+            razorpay_payment_id = params_dict['razorpay_payment_id']
+            razorpay_signature = params_dict['razorpay_signature']
             
             # Verify signature
-            params_dict = {
-                'razorpay_order_id': razorpay_order_id,
-                'razorpay_payment_id': razorpay_payment_id,
-                'razorpay_signature': razorpay_signature
-            }
-            
-            try:
-                razorpay_client.utility.verify_payment_signature(params_dict)
+            if not _payment_signature_valid(params_dict):
+                # Mark donation as failed in a single UPDATE; a forged callback
+                # must never downgrade a donation that was already paid
+                updated = Donation.objects.filter(razorpay_order_id=razorpay_order_id).exclude(
+                    status='success'
+                ).update(status='failed', updated_at=timezone.now())
+                if not updated and not Donation.objects.filter(razorpay_order_id=razorpay_order_id).exists():
+                    return JsonResponse({'status': 'error', 'error': 'Donation matching query does not exist.'})
                 
-                # Update donation record
-                donation = Donation.objects.get(razorpay_order_id=razorpay_order_id)
+                return JsonResponse({'status': 'failed', 'error': 'Signature verification failed'})
+            
+            # Retried callback for a payment we already recorded: nothing to do
+            # (and no second receipt email)
+            donation_id = Donation.objects.filter(
+                razorpay_order_id=razorpay_order_id,
+                transaction_id=razorpay_payment_id,
+                status='success',
+            ).values_list('id', flat=True).first()
+            if donation_id is not None:
+                return JsonResponse({'status': 'success', 'donation_id': donation_id})
+            
+            # Update donation record (the instance is still needed for the receipt)
+            with transaction.atomic():
+                donation = Donation.objects.select_for_update().get(razorpay_order_id=razorpay_order_id)
+                # A concurrent retry may have recorded it since the check above
+                if donation.status == 'success' and donation.transaction_id == razorpay_payment_id:
+                    return JsonResponse({'status': 'success', 'donation_id': donation.id})
                 donation.transaction_id = razorpay_payment_id
                 donation.razorpay_signature = razorpay_signature
                 donation.status = 'success'
-                donation.save()
-                
-                # Send confirmation email to donor (non-blocking - failure doesn't affect donation)
-                try:
-                    send_donation_receipt(donation)
-                except Exception as email_error:
-                    # Log error but don't fail the donation
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Failed to send donation receipt email: {email_error}")
-                
-                return JsonResponse({'status': 'success', 'donation_id': donation.id})
-                
-            except razorpay.errors.SignatureVerificationError:
-                # Update donation as failed
-                donation = Donation.objects.get(razorpay_order_id=razorpay_order_id)
-                donation.status = 'failed'
-                donation.save()
-                
-                return JsonResponse({'status': 'failed', 'error': 'Signature verification failed'})
+                donation.save(update_fields=['transaction_id', 'razorpay_signature', 'status', 'updated_at'])
+            
+            # Queue confirmation email to donor (sent in background - failure doesn't affect donation)
+            queue_donation_receipt(donation)
+            
+            return JsonResponse({'status': 'success', 'donation_id': donation.id})
                 
         except Exception as e:
             return JsonResponse({'status': 'error', 'error': str(e)})
@@ -281,6 +460,7 @@ def payment_success(request):
     return render(request, 'payment_success.html', context)
 
 
+@static_page
 def payment_failed(request):
     """
     Page shown when payment fails.
@@ -288,6 +468,7 @@ def payment_failed(request):
     return render(request, 'payment_failed.html')
 
 
+@static_page
 def privacy_policy(request):
     """
     Privacy Policy page - required for Razorpay compliance.
@@ -295,6 +476,7 @@ def privacy_policy(request):
     return render(request, 'privacy.html')
 
 
+@static_page
 def terms_conditions(request):
     """
     Terms & Conditions page - required for Razorpay compliance.
@@ -302,6 +484,7 @@ def terms_conditions(request):
     return render(request, 'terms.html')
 
 
+@static_page
 def refund_policy(request):
     """
     Refund Policy page - required for Razorpay compliance.
@@ -317,50 +500,57 @@ def verify_payment(request):
     Rate limited to 5 requests per minute per IP to prevent abuse.
     """
     if request.method == "POST":
-        data = json.loads(request.body)
+        try:
+            data = _razorpay_params(request)
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({'status': 'failure', 'error': 'Missing or invalid payment details'}, status=400)
         
         try:
             # Step 1: Verify signature (ensures data wasn't tampered in transit)
-            razorpay_client.utility.verify_payment_signature({
-                'razorpay_order_id': data['razorpay_order_id'],
-                'razorpay_payment_id': data['razorpay_payment_id'],
-                'razorpay_signature': data['razorpay_signature']
-            })
-            
-            # Step 2: Fetch payment details from Razorpay to verify amount
-            payment = razorpay_client.payment.fetch(data['razorpay_payment_id'])
-            amount_paid_paise = payment['amount']  # Amount in paise from Razorpay
+            if not _payment_signature_valid(data):
+                return JsonResponse({'status': 'failure', 'error': 'Signature verification failed'}, status=400)
             
-            # Step 3: Get our stored order and verify amount matches
-            donation = Donation.objects.get(razorpay_order_id=data['razorpay_order_id'])
-            expected_amount_paise = int(donation.amount * 100)
+            # Retried callback for a payment we already recorded: nothing to do
+            # (and no second receipt email)
+            if Donation.objects.filter(
+                razorpay_order_id=data['razorpay_order_id'],
+                transaction_id=data['razorpay_payment_id'],
+                status='success',
+            ).exists():
+                return JsonResponse({'status': 'success'})
             
-            if amount_paid_paise != expected_amount_paise:
-                # Amount mismatch - potential tampering attempt!
-                return JsonResponse({
-                    'status': 'failure', 
-                    'error': 'Amount mismatch. Payment rejected for security.'
-                }, status=400)
+            # Step 2: Fetch payment details from Razorpay to verify amount
+            amount_paid_paise = _payment_amount_paise(data['razorpay_payment_id'])
             
-            # Step 4: All checks passed - Update Database
-            donation.transaction_id = data['razorpay_payment_id']
-            donation.status = 'success'
-            donation.save()
+            # Steps 3-4 in one short transaction, after the Razorpay calls, so
+            # the row lock isn't held across network round trips
+            with transaction.atomic():
+                # Step 3: Get our stored order and verify amount matches
+                donation = Donation.objects.select_for_update().get(
+                    razorpay_order_id=data['razorpay_order_id']
+                )
+                # A concurrent retry may have recorded it since the check above
+                if donation.status == 'success' and donation.transaction_id == data['razorpay_payment_id']:
+                    return JsonResponse({'status': 'success'})
+                if amount_paid_paise != donation.amount_paise:
+                    # Amount mismatch - potential tampering attempt!
+                    return JsonResponse({
+                        'status': 'failure', 
+                        'error': 'Amount mismatch. Payment rejected for security.'
+                    }, status=400)
+                
+                # Step 4: All checks passed - Update Database
+                donation.transaction_id = data['razorpay_payment_id']
+                donation.status = 'success'
+                donation.save(update_fields=['transaction_id', 'status', 'updated_at'])
             
-            # Send confirmation email
-            try:
-                send_donation_receipt(donation)
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to send email in verify_payment: {e}")
+            # Queue confirmation email (sent in background)
+            queue_donation_receipt(donation)
             
             return JsonResponse({'status': 'success'})
             
             return JsonResponse({'status': 'success'})
             
-        except razorpay.errors.SignatureVerificationError:
-            return JsonResponse({'status': 'failure', 'error': 'Signature verification failed'}, status=400)
         except Donation.DoesNotExist:
             return JsonResponse({'status': 'failure', 'error': 'Order not found'}, status=400)
         except Exception as e:
@@ -381,13 +571,13 @@ def donate_page(request):
         # Get amount from form
         try:
             amount = int(request.POST.get('amount', 0))
-            if amount < 10:
-                return HttpResponse("Minimum donation is ₹10", status=400)
+            if amount < MIN_DONATION_AMOUNT:
+                return HttpResponse(f"Minimum donation is ₹{MIN_DONATION_AMOUNT}", status=400)
         except (ValueError, TypeError):
             return HttpResponse("Invalid amount", status=400)
         
         # Create Razorpay Order
-        action = razorpay_client.order.create({
+        action = get_razorpay_client().order.create({
             "amount": amount * 100,  # Convert to paise
             "currency": "INR",
             "payment_capture": "1"